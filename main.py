@@ -2,16 +2,34 @@
 # Clean folder structure for easy template management
 
 from flask import Flask, request, send_file, jsonify
-import tempfile
+from flask.json.provider import DefaultJSONProvider
+import base64
+import hashlib
+import io
 import os
-import subprocess
 import logging
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from datetime import datetime
 from PIL import Image
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-import json
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, select_autoescape
+from playwright.sync_api import sync_playwright
+import orjson
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -38,74 +56,236 @@ jinja_env = Environment(
     loader=FileSystemLoader(TEMPLATES_DIR),
     autoescape=select_autoescape(['html', 'xml'])
 )
+# Display config never changes, so expose it as a Jinja global instead of
+# re-binding it into every render's context
+jinja_env.globals['display'] = DISPLAY_CONFIG
+
+def precompile_templates():
+    """Pre-compile all discovered templates so first renders skip parsing"""
+    compiled = {}
+    if not os.path.exists(TEMPLATES_DIR):
+        return compiled
+    for filename in os.listdir(TEMPLATES_DIR):
+        if filename.endswith('.html'):
+            try:
+                compiled[filename[:-5]] = jinja_env.get_template(filename)
+            except Exception as e:
+                logger.warning(f"Failed to pre-compile template {filename}: {e}")
+    return compiled
+
+# Compiled template cache, warmed once at process boot
+COMPILED_TEMPLATES = precompile_templates()
+
+# Directory for ahead-of-time compiled template modules
+COMPILED_MODULES_DIR = os.path.join(TEMPLATES_DIR, '_compiled')
+
+def compile_templates_to_modules():
+    """AOT-compile templates to Python modules so loads skip parse/codegen"""
+    try:
+        jinja_env.compile_templates(COMPILED_MODULES_DIR, zip=None)
+        # Serve loads from the compiled modules, falling back to the
+        # filesystem for templates added after this compile
+        jinja_env.loader = ChoiceLoader([
+            ModuleLoader(COMPILED_MODULES_DIR),
+            FileSystemLoader(TEMPLATES_DIR)
+        ])
+        return True
+    except Exception as e:
+        logger.warning(f"Template AOT compilation failed: {e}")
+        return False
+
+def build_eink_palette():
+    """Build a PIL palette image matching the display's 7 hardware colors"""
+    channels = []
+    for hex_color in DISPLAY_CONFIG['colors'].values():
+        value = hex_color.lstrip('#')
+        channels.extend(int(value[i:i+2], 16) for i in (0, 2, 4))
+    channels.extend([0] * (768 - len(channels)))
+
+    palette = Image.new('P', (1, 1))
+    palette.putpalette(channels)
+    return palette
+
+# Fixed palette for quantizing screenshots to what the display can show
+EINK_PALETTE = build_eink_palette()
+
+def quantize_for_display(image):
+    """Map an RGB render onto the display's 7-color palette"""
+    # The PNG is then saved as an indexed image, far smaller and faster to
+    # encode than RGB
+    return image.convert('RGB').quantize(palette=EINK_PALETTE,
+                                         dither=Image.Dither.FLOYDSTEINBERG)
+
+# Browser pool setup
+BROWSER_POOL_SIZE = 4
+BROWSER_POOL_RECYCLE_AFTER = 100
+BROWSER_CHECKOUT_TIMEOUT = 30  # seconds to wait for a render worker and its screenshot
+
+# Opt into hardware rasterization where a GPU exists; software rendering
+# stays the default for headless servers and Pis without one
+USE_GPU = os.environ.get('RENDER_USE_GPU', '').lower() in ('1', 'true', 'yes')
+
+CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-background-networking",
+    "--disable-dev-shm-usage",
+    "--hide-scrollbars",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--mute-audio",
+    "--no-zygote",
+    "--disable-sync",
+    "--disable-features=Translate,BackForwardCache,MediaRouter",
+    "--js-flags=--max_old_space_size=128"
+]
+
+if USE_GPU:
+    CHROMIUM_ARGS.remove("--disable-gpu")
+    CHROMIUM_ARGS += ["--use-gl=angle", "--use-angle=vulkan"]
+
+class BrowserPool:
+    """One headless Chromium instance per render worker thread
+
+    The Playwright sync API is thread-affine: a browser may only be used
+    from the thread that started its Playwright instance. Each IO_POOL
+    worker therefore owns its own Playwright + browser, launched lazily on
+    first use in that thread and recycled in place after too many uses.
+    """
+
+    def __init__(self, recycle_after=BROWSER_POOL_RECYCLE_AFTER):
+        self.recycle_after = recycle_after
+        self._local = threading.local()
+
+    def browser(self):
+        """The calling thread's browser, launched on first use"""
+        if getattr(self._local, 'browser', None) is None:
+            self._local.playwright = sync_playwright().start()
+            self._local.browser = self._local.playwright.chromium.launch(args=CHROMIUM_ARGS)
+            self._local.uses = 0
+            logger.info(f"Launched browser for {threading.current_thread().name}")
+        return self._local.browser
+
+    def version(self):
+        """Chromium version string (must run on a render worker)"""
+        return self.browser().version
+
+    def note_use(self):
+        """Count a use and recycle the thread's browser when worn out"""
+        if getattr(self._local, 'browser', None) is None:
+            return
+        self._local.uses += 1
+        if self._local.uses >= self.recycle_after:
+            logger.info(f"Recycling browser after {self._local.uses} uses")
+            try:
+                self._local.browser.close()
+            except Exception as e:
+                logger.warning(f"Failed to close recycled browser: {e}")
+            self._local.browser = self._local.playwright.chromium.launch(args=CHROMIUM_ARGS)
+            self._local.uses = 0
+
+    def warm_up(self):
+        """Pre-launch one browser on every render worker at startup"""
+        # The barrier holds each worker until all have launched, so no
+        # worker picks up two warm-up tasks
+        barrier = threading.Barrier(BROWSER_POOL_SIZE)
+
+        def warm():
+            browser = self.browser()
+            try:
+                barrier.wait(timeout=60)
+            except threading.BrokenBarrierError:
+                pass
+            return browser
+
+        futures = [IO_POOL.submit(warm) for _ in range(BROWSER_POOL_SIZE)]
+        for future in futures:
+            future.result()
+        logger.info(f"Browser pool ready with {BROWSER_POOL_SIZE} instances")
+
+browser_pool = BrowserPool()
+
+# Task pools: CPU-bound stages (Jinja render, PNG encode) run on CPU_POOL
+# while browser work runs on IO_POOL, whose size bounds how many browsers
+# exist and how many screenshots run at once
+CPU_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix='render-cpu')
+IO_POOL = ThreadPoolExecutor(max_workers=BROWSER_POOL_SIZE, thread_name_prefix='render-io')
 
 def take_screenshot(target, dimensions, timeout_ms=5000):
-    """Take screenshot using chromium-headless-shell directly"""
+    """Take screenshot on the calling render worker's browser
+
+    Must run on an IO_POOL worker: the thread-affine sync Playwright API
+    only allows browser calls from the thread that launched the browser.
+    """
     image = None
-    img_file_path = None
-    
+
     try:
-        # Create a temporary output file for the screenshot
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as img_file:
-            img_file_path = img_file.name
-            
-        command = [
-            "chromium-headless-shell",
-            target,
-            "--headless",
-            f"--screenshot={img_file_path}",
-            f"--window-size={dimensions[0]},{dimensions[1]}",
-            "--no-sandbox",
-            "--disable-gpu",
-            "--disable-software-rasterizer",
-            "--disable-background-networking",
-            "--disable-dev-shm-usage",
-            "--hide-scrollbars",
-            "--single-process",
-            "--disable-extensions",
-            "--disable-plugins",
-            "--mute-audio",
-            "--js-flags=--max_old_space_size=128"
-        ]
-        
-        if timeout_ms:
-            command.append(f"--timeout={timeout_ms}")
-            
-        logger.info(f"Taking screenshot for: {os.path.basename(target)}")
-        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # Check if the process failed or the output file is missing
-        if result.returncode != 0 or not os.path.exists(img_file_path):
-            logger.error("Failed to take screenshot:")
-            logger.error(result.stderr.decode('utf-8'))
-            return None
-            
-        # Load the image using PIL
-        with Image.open(img_file_path) as img:
-            image = img.copy()
-            
+        logger.info(f"Taking screenshot ({dimensions[0]}x{dimensions[1]})")
+
+        context = browser_pool.browser().new_context()
+        try:
+            page = context.new_page()
+            page.set_viewport_size({'width': dimensions[0], 'height': dimensions[1]})
+            page.goto(target, timeout=timeout_ms)
+            png_bytes = page.screenshot()
+        finally:
+            context.close()
+
+        # Load the image using PIL straight from the screenshot bytes
+        image = Image.open(io.BytesIO(png_bytes))
+        image.load()
+
+        # Quantize to the 7-color e-ink palette
+        image = quantize_for_display(image)
+
     except Exception as e:
         logger.error(f"Failed to take screenshot: {str(e)}")
         return None
     finally:
-        # Clean up temp file
-        if img_file_path and os.path.exists(img_file_path):
-            os.remove(img_file_path)
-    
+        browser_pool.note_use()
+
     return image
 
+def submit_screenshot(target, dimensions):
+    """Run take_screenshot on a render worker, failing fast under overload
+
+    Returns None when no worker finishes within BROWSER_CHECKOUT_TIMEOUT,
+    so overloaded requests error out instead of piling up.
+    """
+    future = IO_POOL.submit(take_screenshot, target, dimensions)
+    try:
+        return future.result(timeout=BROWSER_CHECKOUT_TIMEOUT)
+    except FutureTimeout:
+        logger.error(f"No render worker free within {BROWSER_CHECKOUT_TIMEOUT}s, dropping render")
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _time_context(minute_bucket):
+    """Formatted time strings, shared by every render in the same minute"""
+    now = datetime.now()
+    return {
+        'current_time': now.strftime('%H:%M'),
+        'current_date': now.strftime('%Y-%m-%d'),
+        'day_of_week': now.strftime('%A')
+    }
+
+def time_context():
+    """Current time strings for the template context"""
+    return _time_context(int(time.time() // 60))
+
 def render_template(template_name, data):
     """Render Jinja2 template with data"""
     try:
-        template = jinja_env.get_template(f"{template_name}.html")
-        
-        # Add display config and current time to template context
+        template = COMPILED_TEMPLATES.get(template_name)
+        if template is None:
+            # Cache miss - template added after boot
+            template = jinja_env.get_template(f"{template_name}.html")
+            COMPILED_TEMPLATES[template_name] = template
+
+        # Add current time to template context (display is a Jinja global)
         template_data = {
             **data,
-            'display': DISPLAY_CONFIG,
-            'current_time': datetime.now().strftime('%H:%M'),
-            'current_date': datetime.now().strftime('%Y-%m-%d'),
-            'day_of_week': datetime.now().strftime('%A')
+            **time_context()
         }
         
         return template.render(**template_data)
@@ -114,83 +294,211 @@ def render_template(template_name, data):
         logger.error(f"Template render error for {template_name}: {e}")
         return None
 
-def create_html_file(html_content):
-    """Create temporary HTML file"""
+def render_with_weasyprint(html_content):
+    """Render static HTML with WeasyPrint - no browser needed"""
     try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as html_file:
-            html_file.write(html_content)
-            return html_file.name
+        import weasyprint  # Lazy import: only templates that opt in pay for it
+
+        # WeasyPrint paginates to CSS @page (A4 by default), not the body
+        # size the templates set, so pin the page to the display resolution
+        # like the Chromium viewport does
+        page_css = weasyprint.CSS(string=(
+            f"@page {{ size: {DISPLAY_CONFIG['width']}px {DISPLAY_CONFIG['height']}px; margin: 0 }}"
+        ))
+        png_bytes = weasyprint.HTML(string=html_content).write_png(stylesheets=[page_css])
+
+        image = Image.open(io.BytesIO(png_bytes))
+        image.load()
+
+        return quantize_for_display(image)
+
     except Exception as e:
-        logger.error(f"Failed to create HTML file: {e}")
+        logger.error(f"WeasyPrint render failed: {e}")
         return None
 
 def render_html_to_image(template_name, data):
     """Complete pipeline: template -> HTML -> image"""
-    html_file_path = None
-    
     try:
-        # Render template
-        html_content = render_template(template_name, data)
+        # Render template (CPU-bound)
+        html_content = CPU_POOL.submit(render_template, template_name, data).result()
         if not html_content:
             return None
-            
-        # Create temporary HTML file
-        html_file_path = create_html_file(html_content)
-        if not html_file_path:
-            return None
-        
-        # Take screenshot using chromium-headless-shell
-        dimensions = (DISPLAY_CONFIG['width'], DISPLAY_CONFIG['height'])
-        image = take_screenshot(f"file://{html_file_path}", dimensions)
-        
+
+        image = None
+
+        # Static JS-free templates can declare "renderer": "weasyprint" in
+        # their config to skip Chromium entirely
+        renderer = load_template_config(template_name).get('renderer', 'chromium')
+        if renderer == 'weasyprint':
+            image = CPU_POOL.submit(render_with_weasyprint, html_content).result()
+
+        if image is None:
+            # Hand the HTML to the browser as a data: URL - no temp file needed
+            encoded_html = base64.b64encode(html_content.encode('utf-8')).decode('ascii')
+
+            # Take screenshot using the browser pool (I/O-bound)
+            dimensions = (DISPLAY_CONFIG['width'], DISPLAY_CONFIG['height'])
+            image = submit_screenshot(f"data:text/html;base64,{encoded_html}", dimensions)
+
         return image
-        
+
     except Exception as e:
         logger.error(f"Render pipeline error: {e}")
         return None
-    finally:
-        # Clean up HTML file
-        if html_file_path and os.path.exists(html_file_path):
-            os.remove(html_file_path)
-
-def image_to_response(image, filename):
-    """Convert PIL Image to Flask response"""
-    if not image:
-        return jsonify({'error': 'Failed to generate image'}), 500
-        
-    # Save image to temporary file for response
-    with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-        image.save(tmp_file.name, 'PNG')
-        return send_file(tmp_file.name, mimetype='image/png', 
-                        as_attachment=False, download_name=filename)
 
-def load_template_config(template_name):
-    """Load template configuration if it exists"""
+def render_composite(regions):
+    """Render several templates into one screenshot
+
+    Each region places one template's output in an absolutely positioned
+    iframe, so a dashboard-style display costs a single browser navigation
+    instead of one per template.
+    """
+    try:
+        frames = []
+        for region in regions:
+            template_name = region['template']
+            data = dict(region.get('data', {}))
+
+            # Apply defaults from the region template's config
+            template_config = load_template_config(template_name)
+            if 'defaults' in template_config:
+                for key, value in template_config['defaults'].items():
+                    if key not in data:
+                        data[key] = value
+
+            html_content = CPU_POOL.submit(render_template, template_name, data).result()
+            if not html_content:
+                return None
+
+            encoded_html = base64.b64encode(html_content.encode('utf-8')).decode('ascii')
+            style = (f"left:{int(region.get('x', 0))}px;"
+                     f"top:{int(region.get('y', 0))}px;"
+                     f"width:{int(region.get('w', DISPLAY_CONFIG['width']))}px;"
+                     f"height:{int(region.get('h', DISPLAY_CONFIG['height']))}px;")
+            frames.append(f'<iframe src="data:text/html;base64,{encoded_html}" style="{style}"></iframe>')
+
+        page_html = (
+            '<!doctype html><html><head><meta charset="UTF-8"><style>'
+            f"body {{ margin: 0; background: {DISPLAY_CONFIG['colors']['white']}; }}"
+            'iframe { border: none; position: absolute; }'
+            '</style></head><body>'
+            + ''.join(frames) +
+            '</body></html>'
+        )
+
+        # One screenshot for the whole composition
+        encoded_page = base64.b64encode(page_html.encode('utf-8')).decode('ascii')
+        dimensions = (DISPLAY_CONFIG['width'], DISPLAY_CONFIG['height'])
+        return submit_screenshot(f"data:text/html;base64,{encoded_page}", dimensions)
+
+    except Exception as e:
+        logger.error(f"Composite render error: {e}")
+        return None
+
+def image_to_png_bytes(image):
+    """Encode a PIL Image to PNG bytes (CPU-bound, runs on CPU_POOL)"""
+    buffer = io.BytesIO()
+    # Low compression - the PNG is transient, so favour encode speed over size
+    CPU_POOL.submit(image.save, buffer, 'PNG', compress_level=1, optimize=False).result()
+    return buffer.getvalue()
+
+def png_response(png_bytes, filename):
+    """Build a Flask response serving PNG bytes from memory"""
+    # Pollers send back our ETag; answer 304 when the image is unchanged -
+    # the fastest render is the one we never ship
+    etag = hashlib.blake2b(png_bytes, digest_size=16).hexdigest()
+    if request.if_none_match.contains(etag):
+        # A 304 must re-send the validator and freshness headers (RFC 7232)
+        response = app.response_class(status=304)
+    else:
+        response = send_file(io.BytesIO(png_bytes), mimetype='image/png',
+                            as_attachment=False, download_name=filename)
+    response.set_etag(etag)
+    # Just under the minute bucket the render cache and time context use
+    response.cache_control.max_age = 55
+    return response
+
+# Rendered-PNG cache: identical requests landing in the same minute skip
+# the whole render pipeline (e-ink displays poll on fixed schedules)
+RENDER_CACHE_SIZE = 64
+_render_cache = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+def render_cache_key(template_name, data):
+    """Cache key over template, request data and the current minute"""
+    payload = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    minute_bucket = str(int(time.time() // 60)).encode('ascii')
+    return hashlib.blake2b(payload + template_name.encode('utf-8') + minute_bucket).digest()
+
+def render_cache_get(key):
+    with _render_cache_lock:
+        png_bytes = _render_cache.get(key)
+        if png_bytes is not None:
+            _render_cache.move_to_end(key)
+        return png_bytes
+
+def render_cache_put(key, png_bytes):
+    with _render_cache_lock:
+        _render_cache[key] = png_bytes
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+
+@functools.lru_cache(maxsize=1)
+def _scan_templates(mtime_ns):
+    """Scan TEMPLATES_DIR in one pass, re-run only when the dir changes"""
+    template_names = []
+    config_names = set()
+    with os.scandir(TEMPLATES_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if entry.name.endswith('.html'):
+                template_names.append(entry.name[:-5])
+            elif entry.name.endswith('.json'):
+                config_names.add(entry.name[:-5])
+    return template_names, config_names
+
+def scan_templates():
+    """Cached (template names, config names) listing of TEMPLATES_DIR"""
+    if not os.path.exists(TEMPLATES_DIR):
+        return [], set()
+    return _scan_templates(os.stat(TEMPLATES_DIR).st_mtime_ns)
+
+@functools.lru_cache(maxsize=128)
+def _load_template_config(template_name, mtime_ns):
+    """Read and parse a template's JSON config (keyed by dir mtime)"""
     config_path = os.path.join(TEMPLATES_DIR, f"{template_name}.json")
-    if os.path.exists(config_path):
-        try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to load config for {template_name}: {e}")
-    return {}
+    try:
+        with open(config_path, 'rb') as f:
+            return orjson.loads(f.read())
+    except Exception as e:
+        logger.warning(f"Failed to load config for {template_name}: {e}")
+        return {}
+
+def load_template_config(template_name):
+    """Load template configuration if it exists (cached until the dir changes)"""
+    if not os.path.exists(TEMPLATES_DIR):
+        return {}
+    # Share the scan's mtime key so config contents invalidate together
+    # with the directory listing
+    mtime_ns = os.stat(TEMPLATES_DIR).st_mtime_ns
+    if template_name not in _scan_templates(mtime_ns)[1]:
+        return {}
+    return _load_template_config(template_name, mtime_ns)
 
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check with chromium and template directory test"""
     try:
-        # Test chromium availability
-        result = subprocess.run(['chromium-headless-shell', '--version'], 
-                              capture_output=True, text=True, timeout=5)
-        chromium_version = result.stdout.strip() if result.returncode == 0 else "Not available"
-        
-        # Check templates directory
-        templates_exist = os.path.exists(TEMPLATES_DIR)
-        available_templates = []
-        if templates_exist:
-            available_templates = [f.replace('.html', '') for f in os.listdir(TEMPLATES_DIR) 
-                                 if f.endswith('.html')]
-        
+        # Test chromium availability on a render worker (browser calls are
+        # only legal on the thread that owns the browser)
+        version = IO_POOL.submit(browser_pool.version).result(timeout=BROWSER_CHECKOUT_TIMEOUT)
+        chromium_version = f"Chromium {version}"
+
+        # Check templates directory (cached scan)
+        available_templates = scan_templates()[0]
+
         return jsonify({
             'status': 'ok',
             'timestamp': datetime.now().isoformat(),
@@ -221,10 +529,21 @@ def render_generic(template_name):
                 if key not in data:
                     data[key] = value
         
+        # Serve straight from cache if an identical request landed this minute
+        cache_key = render_cache_key(template_name, data)
+        cached = render_cache_get(cache_key)
+        if cached is not None:
+            return png_response(cached, f'{template_name}.png')
+
         # Render template to image
         image = render_html_to_image(template_name, data)
-        return image_to_response(image, f'{template_name}.png')
-        
+        if not image:
+            return jsonify({'error': 'Failed to generate image'}), 500
+
+        png_bytes = image_to_png_bytes(image)
+        render_cache_put(cache_key, png_bytes)
+        return png_response(png_bytes, f'{template_name}.png')
+
     except Exception as e:
         logger.error(f"Generic render error for {template_name}: {e}")
         return jsonify({'error': str(e)}), 500
@@ -245,26 +564,50 @@ def render_todo():
     """Todo display - backwards compatible"""
     return render_generic('todo')
 
+@app.route('/render/composite', methods=['POST'])
+def render_composite_endpoint():
+    """Compose multiple templates into one screenshot"""
+    try:
+        body = request.get_json() or {}
+        regions = body.get('regions', [])
+        if not regions:
+            return jsonify({'error': 'No regions specified'}), 400
+
+        # Composites go through the same render cache as single templates
+        cache_key = render_cache_key('composite', body)
+        cached = render_cache_get(cache_key)
+        if cached is not None:
+            return png_response(cached, 'composite.png')
+
+        image = render_composite(regions)
+        if not image:
+            return jsonify({'error': 'Failed to generate image'}), 500
+
+        png_bytes = image_to_png_bytes(image)
+        render_cache_put(cache_key, png_bytes)
+        return png_response(png_bytes, 'composite.png')
+
+    except Exception as e:
+        logger.error(f"Composite render error: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/templates', methods=['GET'])
 def list_templates():
     """List available templates and their configurations"""
     try:
         if not os.path.exists(TEMPLATES_DIR):
             return jsonify({'templates': [], 'error': 'Templates directory not found'})
-        
+
+        template_names, config_names = scan_templates()
         templates = []
-        for filename in os.listdir(TEMPLATES_DIR):
-            if filename.endswith('.html'):
-                template_name = filename.replace('.html', '')
-                config = load_template_config(template_name)
-                
-                templates.append({
-                    'name': template_name,
-                    'file': filename,
-                    'config': config,
-                    'has_config': os.path.exists(os.path.join(TEMPLATES_DIR, f"{template_name}.json"))
-                })
-        
+        for template_name in template_names:
+            templates.append({
+                'name': template_name,
+                'file': f"{template_name}.html",
+                'config': load_template_config(template_name),
+                'has_config': template_name in config_names
+            })
+
         return jsonify({'templates': templates})
         
     except Exception as e:
@@ -283,21 +626,23 @@ if __name__ == '__main__':
     print("  POST /render/weather          # Weather template (legacy)")
     print("  POST /render/schedule         # Schedule template (legacy)")
     print("  POST /render/todo             # Todo template (legacy)")
+    print("  POST /render/composite        # Multiple templates, one screenshot")
     print("  GET /templates                # List available templates")
     print("  GET /health                   # Health check")
     
-    print("\nTesting chromium availability...")
-    
-    # Test chromium on startup
+    # Compile templates ahead of time so even cold loads skip parsing
+    if compile_templates_to_modules():
+        print(f"✓ Templates compiled to: {COMPILED_MODULES_DIR}")
+
+    print("\nStarting browser pool...")
+
+    # Pre-launch one browser per render worker on startup
     try:
-        result = subprocess.run(['chromium-headless-shell', '--version'], 
-                              capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            print(f"✓ Chromium ready: {result.stdout.strip()}")
-        else:
-            print("✗ Chromium not available - install with: sudo apt install chromium-browser")
+        browser_pool.warm_up()
+        print(f"✓ Browser pool ready: {BROWSER_POOL_SIZE} Chromium instances")
     except Exception as e:
-        print(f"✗ Chromium test failed: {e}")
+        print(f"✗ Browser pool startup failed: {e}")
+        print("  Install browsers with: playwright install chromium")
     
     # Check templates directory
     if os.path.exists(TEMPLATES_DIR):
@@ -306,7 +651,9 @@ if __name__ == '__main__':
     else:
         print(f"✓ Created templates directory: {TEMPLATES_DIR}")
     
-    app.run(host='0.0.0.0', port=3001, debug=False)
+    # Threaded so workers overlap while Chromium is I/O-waiting on page
+    # loads; the IO_POOL/browser queue bound actual screenshot concurrency
+    app.run(host='0.0.0.0', port=3001, debug=False, threaded=True)
 
 """
 FOLDER STRUCTURE:
@@ -7,11 +7,12 @@ import tempfile
 import os
 import subprocess
 import logging
-import json
+import functools
+import orjson
 import argparse
 from datetime import datetime
 from PIL import Image
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, select_autoescape
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -32,19 +33,53 @@ DISPLAY_CONFIG = {
     }
 }
 
+def build_eink_palette():
+    """Build a PIL palette image matching the display's 7 hardware colors"""
+    channels = []
+    for hex_color in DISPLAY_CONFIG['colors'].values():
+        value = hex_color.lstrip('#')
+        channels.extend(int(value[i:i+2], 16) for i in (0, 2, 4))
+    channels.extend([0] * (768 - len(channels)))
+
+    palette = Image.new('P', (1, 1))
+    palette.putpalette(channels)
+    return palette
+
+# Fixed palette for quantizing screenshots to what the display can show
+EINK_PALETTE = build_eink_palette()
+
+# Opt into hardware rasterization where a GPU exists; software rendering
+# stays the default for headless servers and Pis without one
+USE_GPU = os.environ.get('RENDER_USE_GPU', '').lower() in ('1', 'true', 'yes')
+
+# Persistent Chromium profile so repeated runs skip first-launch profile setup
+CHROMIUM_PROFILE_DIR = os.path.join(tempfile.gettempdir(), 'chromium-render-profile')
+os.makedirs(CHROMIUM_PROFILE_DIR, exist_ok=True)
+
+@functools.lru_cache(maxsize=1)
 def setup_jinja_env():
-    """Setup Jinja2 environment"""
+    """Setup Jinja2 environment (built once per process)"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
     templates_dir = os.path.join(os.path.dirname(script_dir), 'templates')
     
     if not os.path.exists(templates_dir):
         logger.error(f"Templates directory not found: {templates_dir}")
         sys.exit(1)
-    
-    return Environment(
-        loader=FileSystemLoader(templates_dir),
+
+    # Reuse AOT-compiled template modules from the service if present;
+    # compiling here would cost more than the single render saves
+    loader = FileSystemLoader(templates_dir)
+    compiled_dir = os.path.join(templates_dir, '_compiled')
+    if os.path.isdir(compiled_dir):
+        loader = ChoiceLoader([ModuleLoader(compiled_dir), loader])
+
+    env = Environment(
+        loader=loader,
         autoescape=select_autoescape(['html', 'xml'])
     )
+    # Display config never changes, so expose it as a Jinja global
+    env.globals['display'] = DISPLAY_CONFIG
+    return env
 
 def take_screenshot(target, dimensions, timeout_ms=5000):
     """Take screenshot using chromium-headless-shell directly"""
@@ -61,19 +96,25 @@ def take_screenshot(target, dimensions, timeout_ms=5000):
             "--headless",
             f"--screenshot={img_file_path}",
             f"--window-size={dimensions[0]},{dimensions[1]}",
+            f"--user-data-dir={CHROMIUM_PROFILE_DIR}",
             "--no-sandbox",
             "--disable-gpu",
-            "--disable-software-rasterizer",
             "--disable-background-networking",
             "--disable-dev-shm-usage",
             "--hide-scrollbars",
-            "--single-process",
             "--disable-extensions",
             "--disable-plugins",
             "--mute-audio",
+            "--no-zygote",
+            "--disable-sync",
+            "--disable-features=Translate,BackForwardCache,MediaRouter",
             "--js-flags=--max_old_space_size=128"
         ]
-        
+
+        if USE_GPU:
+            command.remove("--disable-gpu")
+            command += ["--use-gl=angle", "--use-angle=vulkan"]
+
         if timeout_ms:
             command.append(f"--timeout={timeout_ms}")
             
@@ -87,13 +128,21 @@ def take_screenshot(target, dimensions, timeout_ms=5000):
             
         with Image.open(img_file_path) as img:
             image = img.copy()
-            
+
+        # Quantize to the 7-color e-ink palette - the PNG is then saved as
+        # an indexed image, far smaller and faster to encode than RGB
+        image = image.convert('RGB').quantize(palette=EINK_PALETTE,
+                                              dither=Image.Dither.FLOYDSTEINBERG)
+
     except Exception as e:
         logger.error(f"Failed to take screenshot: {str(e)}")
         return None
     finally:
-        if img_file_path and os.path.exists(img_file_path):
-            os.remove(img_file_path)
+        # unlink directly - no point statting first just to avoid an exception
+        try:
+            os.unlink(img_file_path)
+        except (FileNotFoundError, TypeError):
+            pass
     
     return image
 
@@ -102,12 +151,12 @@ def render_template(jinja_env, template_name, data):
     try:
         template = jinja_env.get_template(f"{template_name}.html")
         
+        now = datetime.now()
         template_data = {
             **data,
-            'display': DISPLAY_CONFIG,
-            'current_time': datetime.now().strftime('%H:%M'),
-            'current_date': datetime.now().strftime('%Y-%m-%d'),
-            'day_of_week': datetime.now().strftime('%A')
+            'current_time': now.strftime('%H:%M'),
+            'current_date': now.strftime('%Y-%m-%d'),
+            'day_of_week': now.strftime('%A')
         }
         
         return template.render(**template_data)
@@ -126,16 +175,17 @@ def create_html_file(html_content):
         logger.error(f"Failed to create HTML file: {e}")
         return None
 
+@functools.lru_cache(maxsize=None)
 def load_template_config(template_name):
-    """Load template configuration if it exists"""
+    """Load template configuration if it exists (cached per template)"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
     templates_dir = os.path.join(os.path.dirname(script_dir), 'templates')
     config_path = os.path.join(templates_dir, f"{template_name}.json")
     
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             logger.warning(f"Failed to load config for {template_name}: {e}")
     return {}
@@ -146,13 +196,13 @@ def load_data_file(data_file_path):
         return {}
     
     try:
-        with open(data_file_path, 'r') as f:
-            return json.load(f)
+        with open(data_file_path, 'rb') as f:
+            return orjson.loads(f.read())
     except Exception as e:
         logger.error(f"Failed to load data file {data_file_path}: {e}")
         sys.exit(1)
 
-def render_html_to_image(template_name, data, output_path=None):
+def render_html_to_image(template_name, data, output_path=None, compress_level=1):
     """Complete pipeline: template -> HTML -> image"""
     html_file_path = None
     
@@ -187,7 +237,7 @@ def render_html_to_image(template_name, data, output_path=None):
         if not output_path:
             output_path = f"{template_name}_output.png"
         
-        image.save(output_path, 'PNG')
+        image.save(output_path, 'PNG', compress_level=compress_level, optimize=False)
         logger.info(f"Image saved to: {output_path}")
         return True
         
@@ -195,8 +245,10 @@ def render_html_to_image(template_name, data, output_path=None):
         logger.error(f"Render pipeline error: {e}")
         return False
     finally:
-        if html_file_path and os.path.exists(html_file_path):
-            os.remove(html_file_path)
+        try:
+            os.unlink(html_file_path)
+        except (FileNotFoundError, TypeError):
+            pass
 
 def main():
     parser = argparse.ArgumentParser(description='Render HTML template to E-Ink optimized PNG')
@@ -204,6 +256,8 @@ def main():
     parser.add_argument('data_file', nargs='?', help='JSON file with template data (optional)')
     parser.add_argument('output', nargs='?', help='Output PNG filename (optional)')
     parser.add_argument('--list-templates', action='store_true', help='List available templates')
+    parser.add_argument('--compress-level', type=int, default=1, choices=range(0, 10),
+                        help='PNG zlib compression level, 0-9 (default: 1, fast)')
     
     args = parser.parse_args()
     
@@ -212,8 +266,9 @@ def main():
         templates_dir = os.path.join(os.path.dirname(script_dir), 'templates')
         
         if os.path.exists(templates_dir):
-            templates = [f.replace('.html', '') for f in os.listdir(templates_dir) 
-                        if f.endswith('.html')]
+            with os.scandir(templates_dir) as entries:
+                templates = [e.name[:-5] for e in entries
+                             if e.is_file() and e.name.endswith('.html')]
             print("Available templates:")
             for template in templates:
                 print(f"  - {template}")
@@ -240,7 +295,8 @@ def main():
     data = load_data_file(args.data_file)
     
     # Render template to image
-    success = render_html_to_image(args.template_name, data, args.output)
+    success = render_html_to_image(args.template_name, data, args.output,
+                                   compress_level=args.compress_level)
     
     if success:
         print(f"Successfully rendered {args.template_name} template")